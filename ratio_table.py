@@ -1,4 +1,33 @@
+import numpy as np
 from docx import Document
+from docx.oxml import OxmlElement
+from docx.oxml.ns import qn
+
+
+def _xml_row(values, cell_width: str):
+    """
+    Build a complete <w:tr> for `values` directly in lxml, mirroring the
+    markup python-docx emits for a filled cell (tcPr/tcW + p/r/t).
+    """
+    tr = OxmlElement("w:tr")
+    for value in values:
+        tc = OxmlElement("w:tc")
+        tc_pr = OxmlElement("w:tcPr")
+        tc_w = OxmlElement("w:tcW")
+        tc_w.set(qn("w:w"), cell_width)
+        tc_w.set(qn("w:type"), "dxa")
+        tc_pr.append(tc_w)
+        tc.append(tc_pr)
+        p = OxmlElement("w:p")
+        r = OxmlElement("w:r")
+        t = OxmlElement("w:t")
+        t.text = value
+        r.append(t)
+        p.append(r)
+        tc.append(p)
+        tr.append(tc)
+    return tr
+
 
 def build_ratio_table_docx(
     out_path: str = "ratios.docx",
@@ -21,21 +50,27 @@ def build_ratio_table_docx(
 
     # Create a new Word document
     doc = Document()
-    # create an (n+1)×(n+1) table
-    tbl = doc.add_table(rows=len(sizes) + 1, cols=len(sizes) + 1)
-
-    # fill headers
-    hdr_cells = tbl.rows[0].cells
-    hdr_cells[0].text = "W/H"
-    for i, h in enumerate(sizes, start=1):
-        hdr_cells[i].text = f'{h}"'
-
-    # fill body
-    for r, w in enumerate(sizes, start=1):
-        row_cells = tbl.rows[r].cells
-        row_cells[0].text = f'{w}"'
-        for c, h in enumerate(sizes, start=1):
-            row_cells[c].text = str(round(w / h, precision))
+    # create an empty table with (n+1) grid columns; rows are appended as raw
+    # XML below instead of going through python-docx's per-cell setters
+    tbl = doc.add_table(rows=0, cols=len(sizes) + 1)
+    tbl_xml = tbl._tbl
+    cell_width = tbl_xml.tblGrid[0].get(qn("w:w"))
+
+    # ratio matrix in one broadcast: R[i, j] = sizes[i] / sizes[j]
+    sizes_np = np.asarray(sizes, dtype=np.float64)
+    # (the quotients match Python's w / h bit for bit; round() is applied to
+    # the plain floats so ties round exactly as before, unlike np.round)
+    ratios = (sizes_np[:, None] / sizes_np[None, :]).tolist()
+
+    # size labels, formatted once and shared by the header and row labels
+    labels = [f'{s}"' for s in sizes]
+
+    # header row
+    tbl_xml.append(_xml_row(["W/H"] + labels, cell_width))
+
+    # body rows
+    for label, row in zip(labels, ratios):
+        tbl_xml.append(_xml_row([label] + [str(round(v, precision)) for v in row], cell_width))
 
     # save the document
     doc.save(out_path)
@@ -1,11 +1,15 @@
 """
 Module to suggest optimal stretcher bar frame sizes for given image dimensions and DPI,
-avoiding repeated recomputation of static candidate frames.
+avoiding repeated recomputation of static sizes and price tables.
 """
 from typing import List, Tuple
-from typing import Dict, Optional
+from typing import Dict, FrozenSet, Iterator, Optional
 from numbers import Number
-import statistics
+import bisect
+import functools
+import math
+
+import numpy as np
 
 
 def get_stretcher_sizes(
@@ -23,11 +27,11 @@ def get_stretcher_sizes(
     return sizes
 
 
-# Precompute static frame candidates (width, height) once at import
+# Precompute the available sizes once at import.  Frame candidates are never
+# materialized as (w, h) pairs up front: the scans form width × height outer
+# products over DPI‑admissible slices of these vectors on demand.
 _STRETCHER_SIZES: List[int] = get_stretcher_sizes()
-_FRAME_CANDIDATES: List[Tuple[int, int]] = [
-    (w, h) for w in _STRETCHER_SIZES for h in _STRETCHER_SIZES
-]
+_SIZES_NP: np.ndarray = np.array(_STRETCHER_SIZES, dtype=np.float64)
 
 # ---- Retail price tables ----------------------------------------------------
 # Source: Blick Art Materials July 2025 sale prices.
@@ -61,6 +65,26 @@ STANDARD_PRICES: Dict[int, float] = {
     50: 7.53, 52: 7.72, 54: 7.74, 60: 8.11
 }
 
+# Array views of the price tables, indexed directly by bar length (NaN where
+# a length is not stocked).  The dicts above remain the authoring source.
+_MAX_BAR_SIZE: int = max(max(_STRETCHER_SIZES), max(HEAVY_PRICES), max(STANDARD_PRICES))
+
+
+def _price_array(prices: Dict[int, float]) -> np.ndarray:
+    arr = np.full(_MAX_BAR_SIZE + 1, np.nan)
+    for length, price in prices.items():
+        arr[length] = price
+    return arr
+
+
+_HEAVY_ARR: np.ndarray = _price_array(HEAVY_PRICES)
+_STD_ARR: np.ndarray = _price_array(STANDARD_PRICES)
+
+# Full‑frame bar cost (2 × width + 2 × height) for every (w, h) length pair,
+# indexed as [bar_w, bar_h]; NaN where either length is unavailable.
+_HEAVY_COST_MX: np.ndarray = np.round(2 * (_HEAVY_ARR[:, None] + _HEAVY_ARR[None, :]), 2)
+_STD_COST_MX: np.ndarray = np.round(2 * (_STD_ARR[:, None] + _STD_ARR[None, :]), 2)
+
 PRINT_BORDER_PER_SIDE_IN: float = 1.5  # user prefers ~3" total wrap
 PRINT_SHIPPING_USD: float = 10.0
 
@@ -80,18 +104,27 @@ PRINT_PRICES: Dict[Tuple[int, int], float] = {
     (10, 10):  3,
 }
 
-# Flatten PRINT_PRICES into (area, price) samples for a crude linear model
-_PRINT_SAMPLES = [
-    (long * short, price)
-    for (long, short), price in PRINT_PRICES.items()
-]
-_area_samples, _price_samples = zip(*_PRINT_SAMPLES)
-_mean_area  = statistics.mean(_area_samples)
-_mean_price = statistics.mean(_price_samples)
-# simple least‑squares slope & intercept for price ≈ intercept + slope * area
-_slope = sum((a - _mean_area) * (p - _mean_price) for a, p in _PRINT_SAMPLES) / \
-         sum((a - _mean_area) ** 2 for a in _area_samples)
-_intercept = _mean_price - _slope * _mean_area
+# PRINT_PRICES ordered cheapest‑first, so the first size that fits is also the
+# cheapest (sorted() is stable: equal prices keep their table order).
+_PRINT_PRICES_SORTED: Tuple[Tuple[Tuple[int, int], float], ...] = tuple(
+    sorted(PRINT_PRICES.items(), key=lambda kv: kv[1])
+)
+
+# Crude linear model price ≈ intercept + slope * area, least‑squares fitted
+# to the PRINT_PRICES samples
+_slope, _intercept = (
+    float(c) for c in np.polyfit(
+        np.array([long * short for long, short in PRINT_PRICES], dtype=np.float64),
+        np.array(list(PRINT_PRICES.values()), dtype=np.float64),
+        1,
+    )
+)
+
+
+def _model_price(area: float) -> float:
+    """Linear‑model print price for `area` (sq in)."""
+    return round(_intercept + _slope * area, 2)
+
 
 def _print_prices(width_in: float, height_in: float) -> Tuple[
         Optional[float],   # table price  (None if no table size fits)
@@ -102,24 +135,124 @@ def _print_prices(width_in: float, height_in: float) -> Tuple[
     long_dim, short_dim = sorted((width_in, height_in), reverse=True)
 
     # ---- TABLE LOOK-UP -------------------------------------------------
-    fits = [
-        (long_tbl, short_tbl, price)
-        for (long_tbl, short_tbl), price in PRINT_PRICES.items()
-        if long_dim <= long_tbl and short_dim <= short_tbl
-    ]
-    if fits:
-        long_tbl, short_tbl, tbl_price = min(fits, key=lambda t: t[2])
-        tbl_size = (long_tbl, short_tbl)
-    else:
-        tbl_price = None
-        tbl_size  = (0, 0)
+    tbl_price = None
+    tbl_size  = (0, 0)
+    for (long_tbl, short_tbl), price in _PRINT_PRICES_SORTED:
+        if long_dim <= long_tbl and short_dim <= short_tbl:
+            tbl_price = price
+            tbl_size  = (long_tbl, short_tbl)
+            break
 
     # ---- LINEAR MODEL --------------------------------------------------
-    model_price = round(_intercept + _slope * (width_in * height_in), 2)
+    model_price = _model_price(width_in * height_in)
 
     return tbl_price, model_price, tbl_size
 
 
+# ---- Print cost tables ------------------------------------------------------
+# Border and shipping are fixed, so the full print cost of every frame is
+# folded in at import, indexed [bar_w, bar_h] like the bar cost matrices.
+_PRINT_DIMS: np.ndarray = np.arange(_MAX_BAR_SIZE + 1) + 2 * PRINT_BORDER_PER_SIDE_IN
+
+_MODEL_COST_MX: np.ndarray = np.round(
+    np.round(_intercept + _slope * np.multiply.outer(_PRINT_DIMS, _PRINT_DIMS), 2)
+    + PRINT_SHIPPING_USD,
+    2,
+)
+
+
+def _print_table_matrices() -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Return (table cost incl. shipping, index into _PRINT_PRICES_SORTED) for
+    every frame; NaN / -1 where no table size fits.  Sizes are painted from
+    the most expensive down, so the cheapest fit is the one left standing.
+    """
+    long_dim = np.maximum.outer(_PRINT_DIMS, _PRINT_DIMS)
+    short_dim = np.minimum.outer(_PRINT_DIMS, _PRINT_DIMS)
+    cost = np.full(long_dim.shape, np.nan)
+    size_idx = np.full(long_dim.shape, -1, dtype=np.int64)
+    for idx in reversed(range(len(_PRINT_PRICES_SORTED))):
+        (long_tbl, short_tbl), price = _PRINT_PRICES_SORTED[idx]
+        fits = (long_dim <= long_tbl) & (short_dim <= short_tbl)
+        cost[fits] = round(price + PRINT_SHIPPING_USD, 2)
+        size_idx[fits] = idx
+    return cost, size_idx
+
+
+_TBL_COST_MX, _TBL_SIZE_IDX_MX = _print_table_matrices()
+
+
+def _print_costs(bar_w: int, bar_h: int) -> Tuple[
+        Optional[float],   # table cost incl. shipping (None if no size fits)
+        float,             # model cost incl. shipping
+        Tuple[int, int]    # table size used or (0,0)
+]:
+    """Return (print_cost_tbl, print_cost_model, tbl_size) for a frame."""
+    if 0 <= bar_w <= _MAX_BAR_SIZE and 0 <= bar_h <= _MAX_BAR_SIZE:
+        tbl = float(_TBL_COST_MX[bar_w, bar_h])
+        idx = int(_TBL_SIZE_IDX_MX[bar_w, bar_h])
+        return (
+            None if math.isnan(tbl) else tbl,
+            float(_MODEL_COST_MX[bar_w, bar_h]),
+            _PRINT_PRICES_SORTED[idx][0] if idx >= 0 else (0, 0),
+        )
+
+    # fan‑scan can fix a side longer than the tables cover; price it directly
+    tbl, model_est, tbl_size = _print_prices(
+        bar_w + 2 * PRINT_BORDER_PER_SIDE_IN,
+        bar_h + 2 * PRINT_BORDER_PER_SIDE_IN,
+    )
+    print_cost_tbl = round(tbl + PRINT_SHIPPING_USD, 2) if tbl is not None else None
+    return print_cost_tbl, round(model_est + PRINT_SHIPPING_USD, 2), tbl_size
+
+
+def _dpi_window(img_px: int, min_dpi: float, max_dpi: float) -> Tuple[int, int]:
+    """
+    Return the half‑open index range ``[lo, hi)`` of _STRETCHER_SIZES whose
+    DPI (``img_px / size``) lies inside ``[min_dpi, max_dpi]``.
+    DPI falls monotonically as the bar grows, so the admissible sizes form a
+    contiguous run that two binary searches locate exactly.
+    """
+    def neg_dpi(size: int) -> float:  # ascending along the sorted sizes
+        return -img_px / size
+
+    lo = bisect.bisect_left(_STRETCHER_SIZES, -max_dpi, key=neg_dpi)
+    hi = bisect.bisect_right(_STRETCHER_SIZES, -min_dpi, key=neg_dpi)
+    return lo, hi
+
+
+def _rank_keys(
+    ws: np.ndarray,
+    hs: np.ndarray,
+    pct: np.ndarray,
+    aspect_ratio: float,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Flattened (primary, secondary) ranking keys.  `ws`, `hs` and `pct` must
+    broadcast to a common shape, which is flattened in row‑major order:
+    (1) area delta, wrap‑around (negative Δ) weighted one‑third as heavily,
+    then (2) how closely the frame's aspect ratio matches the image.
+    """
+    primary = np.where(pct < 0, np.abs(pct) / 3, np.abs(pct))
+    secondary = np.abs(ws / hs - aspect_ratio)
+    primary, secondary = np.broadcast_arrays(primary, secondary)
+    return primary.ravel(), secondary.ravel()
+
+
+def _rank_order(primary: np.ndarray, secondary: np.ndarray, k: int) -> np.ndarray:
+    """
+    Indices of the best ``k`` keys, best first.  np.lexsort is stable, so
+    exact ties keep scan order.
+    When ``k`` is well below the number of keys, a quickselect on `primary`
+    first narrows the field to everything up to the k‑th smallest value
+    (ties included, so the result is identical to a full sort).
+    """
+    if 0 < k < len(primary):
+        kth = primary[np.argpartition(primary, k - 1)[k - 1]]
+        field = np.flatnonzero(primary <= kth)
+        return field[np.lexsort((secondary[field], primary[field]))[:k]]
+    return np.lexsort((secondary, primary))[:k]
+
 
 # ---- Fan‑scan helpers -------------------------------------------------
 def _nearest_sizes(x: float, fan: int = 2) -> List[int]:
@@ -129,9 +262,11 @@ def _nearest_sizes(x: float, fan: int = 2) -> List[int]:
     Always returned in ascending order with duplicates removed.
     """
     x_round = round(x)
-    below = [s for s in _STRETCHER_SIZES if s <= x_round]
-    above = [s for s in _STRETCHER_SIZES if s >= x_round]
-    picks = below[-fan:] + above[:fan]
+    # _STRETCHER_SIZES is sorted: sizes <= x_round end at bisect_right,
+    # sizes >= x_round start at bisect_left (the two differ on an exact hit)
+    hi = bisect.bisect_right(_STRETCHER_SIZES, x_round)
+    lo = bisect.bisect_left(_STRETCHER_SIZES, x_round)
+    picks = _STRETCHER_SIZES[max(0, hi - fan):hi] + _STRETCHER_SIZES[lo:lo + fan]
     # Ensure uniqueness & ordering
     return sorted(dict.fromkeys(picks))
 
@@ -179,9 +314,105 @@ def _fan_candidates(
     return [(w, h) for w in widths for h in heights]
 
 
-def _bar_price(length: int, heavy: bool) -> Optional[float]:
-    table = HEAVY_PRICES if heavy else STANDARD_PRICES
-    return table.get(length)
+def _backfill_frames(
+    img_w_px: int,
+    img_h_px: int,
+    min_dpi: float,
+    max_dpi: float,
+    *,
+    exclude: FrozenSet[Tuple[int, int]],
+) -> Iterator[Tuple[int, int]]:
+    """
+    Yield brute‑force (w, h) frames inside the DPI band, width‑major, skipping
+    those in `exclude` (the frames the fan already evaluated).  Only the
+    admissible windows of _STRETCHER_SIZES are visited.
+    """
+    w_lo, w_hi = _dpi_window(img_w_px, min_dpi, max_dpi)
+    h_lo, h_hi = _dpi_window(img_h_px, min_dpi, max_dpi)
+    heights = _STRETCHER_SIZES[h_lo:h_hi]
+    for w in _STRETCHER_SIZES[w_lo:w_hi]:
+        for h in heights:
+            if (w, h) not in exclude:
+                yield w, h
+
+
+def _bar_costs(bar_w: int, bar_h: int) -> Tuple[Optional[float], Optional[float]]:
+    """Return (heavy_cost, std_cost) for a full frame (2 × width + 2 × height)."""
+    if not (0 <= bar_w <= _MAX_BAR_SIZE and 0 <= bar_h <= _MAX_BAR_SIZE):
+        return None, None  # fan‑scan can fix a side longer than any stocked bar
+    heavy = float(_HEAVY_COST_MX[bar_w, bar_h])
+    std   = float(_STD_COST_MX[bar_w, bar_h])
+    heavy_cost = None if math.isnan(heavy) else heavy
+    std_cost   = None if math.isnan(std)   else std
+    return heavy_cost, std_cost
+
+
+FrameSuggestion = Tuple[
+        int, int, float, float, float,         # bars, dpi, Δ
+        Optional[float], Optional[float],      # heavy, std bar $
+        Optional[float], float, Tuple[int,int],# tbl$, model$, tbl_size
+        float, float,                          # print_w, print_h
+        Optional[float]                        # final_total
+]
+
+
+def _frame_pricing(bar_w: int, bar_h: int) -> Tuple[
+        Optional[float], Optional[float],      # heavy, std bar $
+        Optional[float], float, Tuple[int,int],# tbl$, model$, tbl_size
+        float, float,                          # print_w, print_h
+        Optional[float]                        # final_total
+]:
+    """
+    Price one frame.  Depends only on the bar lengths; in‑range sizes are read
+    from the precomputed bar and print cost matrices.
+    """
+    heavy_cost, std_cost = _bar_costs(bar_w, bar_h)
+
+    # ---- Printing estimates ---------------------------------------
+    print_w = bar_w + 2 * PRINT_BORDER_PER_SIDE_IN
+    print_h = bar_h + 2 * PRINT_BORDER_PER_SIDE_IN
+    print_cost_tbl, print_cost_model, tbl_size = _print_costs(bar_w, bar_h)
+
+    # ---- Final total (cheapest bar + cheapest print) --------------
+    bar_cost = None
+    if heavy_cost is not None and std_cost is not None:
+        bar_cost = min(heavy_cost, std_cost)
+    else:
+        bar_cost = heavy_cost if heavy_cost is not None else std_cost
+
+    chosen_print = min(c for c in [print_cost_tbl, print_cost_model] if c is not None)
+    final_total = round(bar_cost + chosen_print, 2) if bar_cost is not None else None
+
+    return (heavy_cost, std_cost,
+            print_cost_tbl, print_cost_model, tbl_size,
+            print_w, print_h, final_total)
+
+
+def _evaluate_candidate(
+    bar_w: int,
+    bar_h: int,
+    img_width_px: int,
+    img_height_px: int,
+    req_area: float,
+    min_dpi: float,
+    max_dpi: float,
+) -> Optional[FrameSuggestion]:
+    """
+    Build the suggestion tuple for one frame, or None if it falls outside the
+    DPI band.  Only the DPI/area part is per call; pricing is table lookups.
+    """
+    dpi_x = img_width_px / bar_w
+    dpi_y = img_height_px / bar_h
+
+    # Must sit inside the acceptable DPI band
+    if not (min_dpi <= dpi_x <= max_dpi and min_dpi <= dpi_y <= max_dpi):
+        return None
+
+    pct_area_delta = (bar_w * bar_h - req_area) / req_area * 100
+    # Note: when ranking frames we weight wrap‑around (negative Δ)
+    # one‑third as heavily as oversize area, per user preference.
+
+    return (bar_w, bar_h, dpi_x, dpi_y, pct_area_delta) + _frame_pricing(bar_w, bar_h)
 
 
 def suggest_stretcher_frames(
@@ -195,13 +426,7 @@ def suggest_stretcher_frames(
     max_suggestions: int = 16,
     use_fan: bool = False,
     fan_span: int = 2,
-) -> List[Tuple[
-        int, int, float, float, float,         # bars, dpi, Δ
-        Optional[float], Optional[float],      # heavy, std bar $
-        Optional[float], float, Tuple[int,int],# tbl$, model$, tbl_size
-        float, float,                          # print_w, print_h
-        Optional[float]                        # final_total
-]]:
+) -> List[FrameSuggestion]:
     """
     Suggest up to ``max_suggestions`` stretcher‑bar sizes that fit the image.
     You can specify EITHER:
@@ -232,7 +457,39 @@ def suggest_stretcher_frames(
         sorted ascending by absolute pct_area_delta.
         The last three fields are the total retail cost in USD for Heavy‑Duty and Standard bars, or None if unavailable,
         and the total cost (print + flat shipping).
+
+    Results are memoized on the (normalized) inputs, so repeated queries for
+    the same image and target skip the scan entirely.
     """
+    def _norm(x: Optional[Number]) -> Optional[float]:
+        return None if x is None else float(x)
+
+    return list(_suggest_impl(
+        float(img_width_px),
+        float(img_height_px),
+        _norm(target_dpi),
+        _norm(target_width_in),
+        _norm(target_height_in),
+        float(tolerance_pct),
+        int(max_suggestions),
+        bool(use_fan),
+        int(fan_span),
+    ))
+
+
+@functools.lru_cache(maxsize=128)
+def _suggest_impl(
+    img_width_px: float,
+    img_height_px: float,
+    target_dpi: Optional[float],
+    target_width_in: Optional[float],
+    target_height_in: Optional[float],
+    tolerance_pct: float,
+    max_suggestions: int,
+    use_fan: bool,
+    fan_span: int,
+) -> Tuple[FrameSuggestion, ...]:
+    """Cached core of :func:`suggest_stretcher_frames` (returns a tuple)."""
     # ---- Input validation & implied DPI -------------------------------
     # Keep the user‑specified physical dimension (if any) before we overwrite
     # target_dpi below; we’ll need these values for fan‑scan later.
@@ -241,6 +498,8 @@ def suggest_stretcher_frames(
     dpi_inputs = [target_dpi is not None, target_width_in is not None, target_height_in is not None]
     if sum(dpi_inputs) != 1:
         raise ValueError("Specify exactly ONE of target_dpi, target_width_in, or target_height_in")
+    if use_fan and fan_span < 1:
+        raise ValueError("fan_span must be at least 1")
 
     if target_dpi is None:
         if target_width_in is not None:
@@ -272,114 +531,50 @@ def suggest_stretcher_frames(
             fan=fan_span,
         )
     else:
-        candidate_frames = _FRAME_CANDIDATES
+        # ---- Vectorized brute‑force scan ------------------------------
+        # Each axis' admissible sizes are a contiguous slice of the sorted
+        # size list; form the outer product over those windows only.
+        ws = _SIZES_NP[slice(*_dpi_window(img_width_px, min_dpi, max_dpi))]
+        hs = _SIZES_NP[slice(*_dpi_window(img_height_px, min_dpi, max_dpi))]
+
+        pct = (np.multiply.outer(ws, hs) - req_area) / req_area * 100
+        primary, secondary = _rank_keys(ws[:, None], hs[None, :], pct,
+                                        img_width_px / img_height_px)
+        order = _rank_order(primary, secondary, max_suggestions)
+        rows, cols = np.unravel_index(order, pct.shape)
+        candidate_frames = [
+            (int(ws[r]), int(hs[c])) for r, c in zip(rows, cols)
+        ]
 
     candidates = []
     for bar_w, bar_h in candidate_frames:
-        dpi_x = img_width_px / bar_w
-        dpi_y = img_height_px / bar_h
-
-        # Must sit inside the acceptable DPI band
-        if not (min_dpi <= dpi_x <= max_dpi and min_dpi <= dpi_y <= max_dpi):
-            continue
-
-        pct_area_delta = (bar_w * bar_h - req_area) / req_area * 100
-        # Note: when ranking frames we weight wrap‑around (negative Δ)
-        # one‑third as heavily as oversize area, per user preference.
-
-        heavy_cost = None
-        std_cost   = None
-        hp_w = _bar_price(bar_w, heavy=True)
-        hp_h = _bar_price(bar_h, heavy=True)
-        if hp_w is not None and hp_h is not None:
-            heavy_cost = round(2 * (hp_w + hp_h), 2)
-
-        sp_w = _bar_price(bar_w, heavy=False)
-        sp_h = _bar_price(bar_h, heavy=False)
-        if sp_w is not None and sp_h is not None:
-            std_cost = round(2 * (sp_w + sp_h), 2)
-
-        # ---- Printing estimates ---------------------------------------
-        print_w = bar_w + 2 * PRINT_BORDER_PER_SIDE_IN
-        print_h = bar_h + 2 * PRINT_BORDER_PER_SIDE_IN
-        tbl, model_est, tbl_size = _print_prices(print_w, print_h)
-
-        if tbl is not None:
-            print_cost_tbl    = round(tbl    + PRINT_SHIPPING_USD, 2)
-        else:
-            print_cost_tbl    = None
-        print_cost_model = round(model_est + PRINT_SHIPPING_USD, 2)
-
-        # ---- Final total (cheapest bar + cheapest print) --------------
-        bar_cost = None
-        if heavy_cost is not None and std_cost is not None:
-            bar_cost = min(heavy_cost, std_cost)
-        else:
-            bar_cost = heavy_cost if heavy_cost is not None else std_cost
-
-        chosen_print = min(c for c in [print_cost_tbl, print_cost_model] if c is not None)
-        final_total = round(bar_cost + chosen_print, 2) if bar_cost is not None else None
-
-        candidates.append(
-            (bar_w, bar_h, dpi_x, dpi_y, pct_area_delta,
-             heavy_cost, std_cost,
-             print_cost_tbl, print_cost_model, tbl_size,
-             print_w, print_h, final_total)
-        )
+        c = _evaluate_candidate(bar_w, bar_h, img_width_px, img_height_px,
+                                req_area, min_dpi, max_dpi)
+        if c:
+            candidates.append(c)
 
     # If fan‑scan did not fill the quota, back‑fill with brute‑force frames
     if use_fan and len(candidates) < max_suggestions:
-        for bar_w, bar_h in _FRAME_CANDIDATES:
-            if (bar_w, bar_h) in candidate_frames:
-                continue  # already evaluated
-            dpi_x = img_width_px / bar_w
-            dpi_y = img_height_px / bar_h
-            if not (min_dpi <= dpi_x <= max_dpi and min_dpi <= dpi_y <= max_dpi):
-                continue
-            pct_area_delta = (bar_w * bar_h - req_area) / req_area * 100
-
-            hp_w = _bar_price(bar_w, heavy=True)
-            hp_h = _bar_price(bar_h, heavy=True)
-            heavy_cost = round(2 * (hp_w + hp_h), 2) if hp_w and hp_h else None
-
-            sp_w = _bar_price(bar_w, heavy=False)
-            sp_h = _bar_price(bar_h, heavy=False)
-            std_cost = round(2 * (sp_w + sp_h), 2) if sp_w and sp_h else None
-
-            print_w = bar_w + 2 * PRINT_BORDER_PER_SIDE_IN
-            print_h = bar_h + 2 * PRINT_BORDER_PER_SIDE_IN
-            tbl, model_est, tbl_size = _print_prices(print_w, print_h)
-            print_cost_tbl = round(tbl + PRINT_SHIPPING_USD, 2) if tbl else None
-            print_cost_model = round(model_est + PRINT_SHIPPING_USD, 2)
-
-            bar_cost = None
-            if heavy_cost and std_cost:
-                bar_cost = min(heavy_cost, std_cost)
-            else:
-                bar_cost = heavy_cost if heavy_cost else std_cost
-
-            chosen_print = min(c for c in [print_cost_tbl, print_cost_model] if c)
-            final_total = round(bar_cost + chosen_print, 2) if bar_cost else None
-
-            candidates.append(
-                (bar_w, bar_h, dpi_x, dpi_y, pct_area_delta,
-                 heavy_cost, std_cost,
-                 print_cost_tbl, print_cost_model, tbl_size,
-                 print_w, print_h, final_total)
-            )
-            if len(candidates) >= max_suggestions:
-                break
-
-    # Rank by (2) how closely the frame’s aspect ratio matches the image,
-    # then (1) the existing area‑delta rule that favors slight wrap‑around.
-    aspect_ratio = img_width_px / img_height_px
-    candidates.sort(
-    key=lambda x: (
-        (abs(x[4]) / 3) if x[4] < 0 else abs(x[4]),   # 1st: area
-        abs((x[0] / x[1]) - aspect_ratio)             # 2nd: aspect
-    )
-)
-    return candidates[:max_suggestions]
+        backfill = _backfill_frames(img_width_px, img_height_px, min_dpi, max_dpi,
+                                    exclude=frozenset(candidate_frames))
+        for bar_w, bar_h in backfill:
+            c = _evaluate_candidate(bar_w, bar_h, img_width_px, img_height_px,
+                                    req_area, min_dpi, max_dpi)
+            if c:
+                candidates.append(c)
+                if len(candidates) >= max_suggestions:
+                    break
+
+    if not use_fan:
+        # Brute‑force frames were already ranked by the vectorized scan
+        return tuple(candidates)
+
+    ws  = np.array([c[0] for c in candidates], dtype=np.float64)
+    hs  = np.array([c[1] for c in candidates], dtype=np.float64)
+    pct = np.array([c[4] for c in candidates], dtype=np.float64)
+    primary, secondary = _rank_keys(ws, hs, pct, img_width_px / img_height_px)
+    order = _rank_order(primary, secondary, max_suggestions)
+    return tuple(candidates[i] for i in order)
 
 
 